@@ -9,68 +9,81 @@ def get_attack_service():
     return current_app.config['attack_service']
 
 
+# Attack endpoint name -> (attack type, request data -> attack parameters)
+ATTACK_BUILDERS = {
+    'double-spending': (AttackType.DOUBLE_SPENDING, lambda data: {
+        'amount': data.get('amount', 100),
+        'attacker_nodes': data.get('attacker_nodes', 5)
+    }),
+    '51-percent': (AttackType.FIFTY_ONE_PERCENT, lambda data: {
+        'hash_power': data.get('hash_power', 55),
+        'duration': data.get('duration', 60)
+    }),
+    'selfish-mining': (AttackType.SELFISH_MINING, lambda data: {
+        'max_blocks': data.get('max_blocks', 3)
+    }),
+    'eclipse': (AttackType.ECLIPSE_ATTACK, lambda data: {
+        'target_node': data.get('target_node', 25),
+        'attacker_nodes': data.get('attacker_nodes', 8),
+        'isolation_time': data.get('isolation_time', 45)
+    }),
+}
+
+
+def _start_attack(name, data):
+    """Start the named attack with parameters taken from request data"""
+    attack_type, build_parameters = ATTACK_BUILDERS[name]
+    return get_attack_service().start_attack(attack_type, build_parameters(data))
+
+
 @attack_bp.route('/api/attack/double-spending', methods=['POST'])
 def start_double_spending():
     """Start Double Spending Attack"""
-    attack_service = get_attack_service()
-    data = request.get_json() or {}
-
-    result = attack_service.start_attack(
-        AttackType.DOUBLE_SPENDING,
-        {
-            'amount': data.get('amount', 100),
-            'attacker_nodes': data.get('attacker_nodes', 5)
-        }
-    )
-    return jsonify(result)
+    return jsonify(_start_attack('double-spending', request.get_json() or {}))
 
 
 @attack_bp.route('/api/attack/51-percent', methods=['POST'])
 def start_51_percent():
     """Start 51% Attack"""
-    attack_service = get_attack_service()
-    data = request.get_json() or {}
-
-    result = attack_service.start_attack(
-        AttackType.FIFTY_ONE_PERCENT,
-        {
-            'hash_power': data.get('hash_power', 55),
-            'duration': data.get('duration', 60)
-        }
-    )
-    return jsonify(result)
+    return jsonify(_start_attack('51-percent', request.get_json() or {}))
 
 
 @attack_bp.route('/api/attack/selfish-mining', methods=['POST'])
 def start_selfish_mining():
     """Start Selfish Mining Attack"""
-    attack_service = get_attack_service()
-    data = request.get_json() or {}
-
-    result = attack_service.start_attack(
-        AttackType.SELFISH_MINING,
-        {
-            'max_blocks': data.get('max_blocks', 3)
-        }
-    )
-    return jsonify(result)
+    return jsonify(_start_attack('selfish-mining', request.get_json() or {}))
 
 
 @attack_bp.route('/api/attack/eclipse', methods=['POST'])
 def start_eclipse_attack():
     """Start Eclipse Attack"""
-    attack_service = get_attack_service()
-    data = request.get_json() or {}
-
-    result = attack_service.start_attack(
-        AttackType.ECLIPSE_ATTACK,
-        {
-            'target_node': data.get('target_node', 25),
-            'attacker_nodes': data.get('attacker_nodes', 8),
-            'isolation_time': data.get('isolation_time', 45)
-        }
-    )
-    return jsonify(result)
+    return jsonify(_start_attack('eclipse', request.get_json() or {}))
+
+
+@attack_bp.route('/api/attack/batch', methods=['POST'])
+def start_attack_batch():
+    """Start several attacks in one request; results follow the order of 'scenarios'"""
+    data = request.get_json()
+    scenarios = data.get('scenarios', []) if isinstance(data, dict) else None
+    if not isinstance(scenarios, list):
+        return jsonify({"status": "error", "message": "Expected an object with a 'scenarios' list"}), 400
+
+    results = []
+    for scenario in scenarios:
+        if not isinstance(scenario, dict):
+            results.append({"status": "error", "message": f"Invalid scenario: {scenario!r}"})
+            continue
+
+        name = scenario.get('endpoint')
+        params = scenario.get('params') or {}
+        if not isinstance(name, str) or name not in ATTACK_BUILDERS:
+            results.append({"status": "error", "message": f"Unknown attack: {name}"})
+        elif not isinstance(params, dict):
+            results.append({"status": "error", "message": f"Invalid params for {name}"})
+        else:
+            results.append(_start_attack(name, params))
+
+    return jsonify({"status": "success", "results": results})
 
 
 @attack_bp.route('/api/attack/active', methods=['GET'])
@@ -4,7 +4,6 @@ import datetime
 # Blueprint define keren
 dashboard_bp = Blueprint('dashboard', __name__)
 
-
 def get_simblock_service():
     """Get simblock service from app context"""
     return current_app.config['simblock_service']
@@ -20,6 +19,21 @@ def get_ml_service():
     return current_app.config['ml_service']
 
 
+def get_kaggle_integration():
+    """Get the Kaggle integration, raising ImportError when it is not installed"""
+    from ml_training.kaggle_integration import kaggle_integration
+    return kaggle_integration
+
+
+# Service name -> status call reported by /api/health/all; a service is healthy when its call returns
+HEALTH_PROBES = {
+    'dashboard': lambda: get_simblock_service().get_status(),
+    'ml': lambda: get_ml_service().get_ml_status(),
+    'attack': lambda: get_attack_service().get_attack_stats(),
+    'kaggle': get_kaggle_integration,
+}
+
+
 @dashboard_bp.route('/')
 def index():
     """Main dashboard page"""
@@ -55,4 +69,18 @@ def dashboard_status():
             'ml_model': ml_status,
             'last_attack': last_attack
         }
-    })
\ No newline at end of file
+    })
+
+
+@dashboard_bp.route('/api/health/all')
+def health_all():
+    """Ask every service for its status and report which ones answered"""
+    health = {}
+    for service, probe in HEALTH_PROBES.items():
+        try:
+            probe()
+            health[service] = True
+        except Exception:
+            health[service] = False
+
+    return jsonify(health)
@@ -1,6 +1,7 @@
 # [file name]: kaggle_routes.py - COMPLETE UPDATED VERSION WITH TRANSACTION DATA
 from flask import Blueprint, jsonify, request, send_file
 import json
+import math
 import os
 import pandas as pd
 from datetime import datetime
@@ -518,7 +519,8 @@ def generate_attack_analysis_csv(reports_dir):
             total_attacks = len(attack_data)
             successful_attacks = sum(1 for attack in attack_data if attack.get('correct_prediction', False))
             success_rate = (successful_attacks / max(1, total_attacks)) * 100
-            total_value_at_risk = sum(attack.get('total_value_at_risk_eth', 0) for attack in attack_data)
+            # math.fsum keeps ETH totals exact instead of accumulating float rounding error
+            total_value_at_risk = math.fsum(attack.get('total_value_at_risk_eth', 0) for attack in attack_data)
 
             attack_data.append({
                 'block_number': 'SUMMARY',
@@ -546,7 +548,7 @@ def generate_attack_analysis_csv(reports_dir):
                 'affected_transactions': sum(attack.get('affected_transactions', 0) for attack in attack_data if
                                              attack.get('block_number') != 'SUMMARY'),
                 'total_value_at_risk_eth': total_value_at_risk,
-                'double_spend_amount_eth': sum(attack.get('double_spend_amount_eth', 0) for attack in attack_data),
+                'double_spend_amount_eth': math.fsum(attack.get('double_spend_amount_eth', 0) for attack in attack_data),
                 'reorg_depth': sum(attack.get('reorg_depth', 0) for attack in attack_data),
                 'orphaned_blocks': sum(attack.get('orphaned_blocks', 0) for attack in attack_data),
                 'network_partition_size': sum(attack.get('network_partition_size', 0) for attack in attack_data),
@@ -1,5 +1,6 @@
 # [file name]: attack_service.py
 
+import itertools
 import threading
 import time
 import random
@@ -21,6 +22,8 @@ class AttackService:
         self.simblock_service = simblock_service
         self.active_attacks = {}
         self.attack_log = "data/attack_logs.json"
+        self._attack_seq = itertools.count(1)  # keeps ids unique when attacks of one type start in the same second
+        self._log_lock = threading.Lock()  # serialises read-modify-write of the attack log across attack threads
         self.attack_stats = {
             "total_attacks": 0,
             "successful_attacks": 0,
@@ -52,7 +55,7 @@ class AttackService:
             print(f"❌ {error_msg}")
             return {"status": "error", "message": error_msg}
 
-        attack_id = f"{attack_type.value}_{int(time.time())}"
+        attack_id = f"{attack_type.value}_{int(time.time())}_{next(self._attack_seq)}"
 
         # Get current block number for attack targeting
         current_block = self.simblock_service.blockchain_data["blocks"]
@@ -334,33 +337,34 @@ class AttackService:
                 else:
                     clean_data[key] = str(value)
 
-            if os.path.exists(self.attack_log):
-                try:
-                    with open(self.attack_log, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                except:
+            with self._log_lock:
+                if os.path.exists(self.attack_log):
+                    try:
+                        with open(self.attack_log, 'r', encoding='utf-8') as f:
+                            data = json.load(f)
+                    except:
+                        data = {
+                            "attack_history": [],
+                            "statistics": self.attack_stats,
+                            "created_at": datetime.now().isoformat()
+                        }
+                else:
                     data = {
                         "attack_history": [],
                         "statistics": self.attack_stats,
                         "created_at": datetime.now().isoformat()
                     }
-            else:
-                data = {
-                    "attack_history": [],
-                    "statistics": self.attack_stats,
-                    "created_at": datetime.now().isoformat()
-                }
 
-            data["attack_history"].append(clean_data)
-            data["statistics"] = {
-                "total_attacks": int(self.attack_stats["total_attacks"]),
-                "successful_attacks": int(self.attack_stats["successful_attacks"]),
-                "failed_attacks": int(self.attack_stats["failed_attacks"])
-            }
-            data["updated_at"] = datetime.now().isoformat()
+                data["attack_history"].append(clean_data)
+                data["statistics"] = {
+                    "total_attacks": int(self.attack_stats["total_attacks"]),
+                    "successful_attacks": int(self.attack_stats["successful_attacks"]),
+                    "failed_attacks": int(self.attack_stats["failed_attacks"])
+                }
+                data["updated_at"] = datetime.now().isoformat()
 
-            with open(self.attack_log, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                with open(self.attack_log, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
 
         except Exception as e:
             print(f"Error logging attack: {e}")
@@ -24,6 +24,90 @@ except ImportError:
     print("⚠️ Kaggle integration not available")
 
 
+# Fixed tail of the feature vector per block status; the first eight
+# features come from the live blockchain data.
+_STATUS_FEATURES = {
+    "attack_success": np.array([
+        0.7,  # mining_pool_concentration
+        2.0,  # orphan_blocks
+        3.0,  # network_latency
+        0.6,  # hash_rate_skew
+        1.5,  # block_reorg_depth
+        25.0,  # gas_price
+        8.0,  # contract_creations
+        5.0,  # failed_transactions
+        3000,  # unique_addresses
+        2.5,  # miner_rewards
+        1.2,  # uncle_blocks
+        0.6,  # hash_power_imbalance
+        0.6,  # network_health
+        8.0,  # mining_efficiency
+        0.85,  # transaction_success_rate
+        -0.002,  # network_growth
+        0.7,  # miner_concentration
+        0.8,  # attack_probability
+        0.7,  # node_connectivity
+        0.2,  # hash_rate_variance
+    ]),
+    "attack_failed": np.array([
+        0.4,  # mining_pool_concentration
+        0.8,  # orphan_blocks
+        2.5,  # network_latency
+        0.3,  # hash_rate_skew
+        0.8,  # block_reorg_depth
+        20.0,  # gas_price
+        12.0,  # contract_creations
+        3.0,  # failed_transactions
+        4500,  # unique_addresses
+        2.2,  # miner_rewards
+        0.6,  # uncle_blocks
+        0.4,  # hash_power_imbalance
+        0.8,  # network_health
+        10.0,  # mining_efficiency
+        0.92,  # transaction_success_rate
+        0.001,  # network_growth
+        0.5,  # miner_concentration
+        0.4,  # attack_probability
+        0.85,  # node_connectivity
+        0.15,  # hash_rate_variance
+    ]),
+}
+
+# Tail used for blocks that are not under attack
+_NORMAL_FEATURES = np.array([
+    0.3,  # mining_pool_concentration
+    0.1,  # orphan_blocks
+    1.8,  # network_latency
+    0.05,  # hash_rate_skew
+    0.05,  # block_reorg_depth
+    18.5,  # gas_price
+    14,  # contract_creations
+    1.2,  # failed_transactions
+    4800,  # unique_addresses
+    2.1,  # miner_rewards
+    0.4,  # uncle_blocks
+    0.25,  # hash_power_imbalance
+    0.92,  # network_health
+    11.5,  # mining_efficiency
+    0.98,  # transaction_success_rate
+    0.003,  # network_growth
+    0.35,  # miner_concentration
+    0.08,  # attack_probability
+    0.94,  # node_connectivity
+    0.06,  # hash_rate_variance
+])
+
+# Prediction returned while no model is trained; only the timestamp changes per call
+_UNTRAINED_RESULT = {
+    "is_anomaly": False,
+    "confidence": 0,
+    "error": "Model not trained",
+    "attack_type": "none",
+    "current_block": 0,
+    "model_version": "v1"
+}
+
+
 class MLService:
     def __init__(self, simblock_service, attack_service):
         self.simblock_service = simblock_service
@@ -140,63 +224,60 @@ class MLService:
 
     def _generate_improved_synthetic_data(self, num_samples):
         """Generate IMPROVED synthetic data with realistic attack patterns"""
-        data = []
-        labels = []
-
-        for i in range(num_samples):
-            # Better distribution - 85% normal, 15% attacks
-            if i < num_samples * 0.85:  # 85% normal
-                features = self._generate_normal_pattern()
-                label = 0
-            else:  # 15% attacks with specific patterns
-                features = self._generate_realistic_attack_pattern()
-                label = 1
-
-            data.append(features)
-            labels.append(label)
-
-        df = pd.DataFrame(data, columns=self.features)
-        df['anomaly'] = labels
+        # Better distribution - 85% normal, 15% attacks with specific patterns
+        normal_count = int(np.ceil(num_samples * 0.85))
+        attack_count = num_samples - normal_count
+
+        normal = self._generate_normal_pattern(normal_count)
+        attacks = self._generate_realistic_attack_pattern(attack_count)
+
+        df = pd.DataFrame({feature: np.concatenate((normal[feature], attacks[feature]))
+                           for feature in self.features})
+        df['anomaly'] = np.repeat([0, 1], [normal_count, attack_count])
         return df
 
-    def _generate_realistic_attack_pattern(self):
-        """Generate realistic attack patterns based on actual attack types"""
-        attack_type = np.random.choice(['51_percent', 'double_spend', 'selfish_mining', 'eclipse'])
-
-        base_pattern = self._generate_normal_pattern()
-
-        if attack_type == '51_percent':
-            # 51% Attack: High mining power concentration
-            base_pattern['mining_power'] = np.random.uniform(40, 70)
-            base_pattern['mining_pool_concentration'] = np.random.uniform(0.7, 0.95)
-            base_pattern['hash_rate_skew'] = np.random.uniform(0.6, 0.9)
-            base_pattern['miner_concentration'] = np.random.uniform(0.8, 1.0)
-            base_pattern['block_reorg_depth'] = np.random.poisson(3)
-
-        elif attack_type == 'double_spend':
-            # Double Spending: High failed transactions
-            base_pattern['failed_transactions'] = np.random.poisson(8)
-            base_pattern['transaction_success_rate'] = np.random.uniform(0.7, 0.85)
-            base_pattern['transaction_volume'] = np.random.lognormal(14, 1.2)
-            base_pattern['gas_price'] = np.random.exponential(30)
-
-        elif attack_type == 'selfish_mining':
-            # Selfish Mining: More orphan blocks
-            base_pattern['orphan_blocks'] = np.random.poisson(2)
-            base_pattern['mining_efficiency'] = np.random.uniform(3, 8)
-            base_pattern['block_time'] = np.random.uniform(15, 25)
-            base_pattern['network_latency'] = np.random.exponential(4)
-
-        else:  # eclipse
-            # Eclipse Attack: Poor network connectivity
-            base_pattern['node_connectivity'] = np.random.uniform(0.1, 0.4)
-            base_pattern['network_health'] = np.random.uniform(0.3, 0.6)
-            base_pattern['network_latency'] = np.random.exponential(6)
-            base_pattern['hash_rate_variance'] = np.random.uniform(0.2, 0.5)
+    def _generate_realistic_attack_pattern(self, size):
+        """Generate realistic attack patterns based on actual attack types, one column array per feature"""
+        attack_types = np.random.choice(['51_percent', 'double_spend', 'selfish_mining', 'eclipse'], size)
+
+        base_pattern = self._generate_normal_pattern(size)
+
+        # 51% Attack: High mining power concentration
+        rows = attack_types == '51_percent'
+        count = rows.sum()
+        base_pattern['mining_power'][rows] = np.random.uniform(40, 70, count)
+        base_pattern['mining_pool_concentration'][rows] = np.random.uniform(0.7, 0.95, count)
+        base_pattern['hash_rate_skew'][rows] = np.random.uniform(0.6, 0.9, count)
+        base_pattern['miner_concentration'][rows] = np.random.uniform(0.8, 1.0, count)
+        base_pattern['block_reorg_depth'][rows] = np.random.poisson(3, count)
+
+        # Double Spending: High failed transactions
+        rows = attack_types == 'double_spend'
+        count = rows.sum()
+        base_pattern['failed_transactions'][rows] = np.random.poisson(8, count)
+        base_pattern['transaction_success_rate'][rows] = np.random.uniform(0.7, 0.85, count)
+        base_pattern['transaction_volume'][rows] = np.random.lognormal(14, 1.2, count)
+        base_pattern['gas_price'][rows] = np.random.exponential(30, count)
+
+        # Selfish Mining: More orphan blocks
+        rows = attack_types == 'selfish_mining'
+        count = rows.sum()
+        base_pattern['orphan_blocks'][rows] = np.random.poisson(2, count)
+        base_pattern['mining_efficiency'][rows] = np.random.uniform(3, 8, count)
+        base_pattern['block_time'][rows] = np.random.uniform(15, 25, count)
+        base_pattern['network_latency'][rows] = np.random.exponential(4, count)
+
+        # Eclipse Attack: Poor network connectivity
+        rows = attack_types == 'eclipse'
+        count = rows.sum()
+        base_pattern['node_connectivity'][rows] = np.random.uniform(0.1, 0.4, count)
+        base_pattern['network_health'][rows] = np.random.uniform(0.3, 0.6, count)
+        base_pattern['network_latency'][rows] = np.random.exponential(6, count)
+        base_pattern['hash_rate_variance'][rows] = np.random.uniform(0.2, 0.5, count)
 
         # Common attack indicators
-        base_pattern['attack_probability'] = np.random.uniform(0.7, 1.0)
-        base_pattern['network_growth'] = np.random.normal(-0.005, 0.002)
+        base_pattern['attack_probability'] = np.random.uniform(0.7, 1.0, size)
+        base_pattern['network_growth'] = np.random.normal(-0.005, 0.002, size)
 
         return base_pattern
 
@@ -242,37 +323,37 @@ class MLService:
 
         return df
 
-    def _generate_normal_pattern(self):
-        """Generate normal pattern with real-world characteristics"""
+    def _generate_normal_pattern(self, size=None):
+        """Generate normal pattern with real-world characteristics (arrays of length size when given)"""
         return {
-            'blocks_mined': np.random.randint(1, 100),
-            'transactions_count': np.random.randint(100, 5000),
-            'network_nodes': np.random.randint(1000, 5000),
-            'mining_power': np.random.uniform(10, 25),
-            'block_time': np.random.uniform(10, 15),
-            'difficulty': np.random.uniform(1e12, 5e13),
-            'hash_rate': np.random.lognormal(20, 1),
-            'transaction_volume': np.random.lognormal(12, 1.5),
-            'mining_pool_concentration': np.random.beta(2, 5),
-            'orphan_blocks': np.random.poisson(0.1),
-            'network_latency': np.random.exponential(2),
-            'hash_rate_skew': np.random.normal(0, 0.1),
-            'block_reorg_depth': np.random.poisson(0.05),
-            'gas_price': np.random.exponential(20),
-            'contract_creations': np.random.poisson(15),
-            'failed_transactions': np.random.poisson(2),
-            'unique_addresses': np.random.normal(5000, 1000),
-            'miner_rewards': np.random.normal(2, 0.3),
-            'uncle_blocks': np.random.poisson(0.5),
-            'hash_power_imbalance': np.random.beta(1, 3),
-            'network_health': np.random.uniform(0.7, 1.0),
-            'mining_efficiency': np.random.uniform(5, 15),
-            'transaction_success_rate': np.random.uniform(0.95, 0.99),
-            'network_growth': np.random.normal(0.001, 0.005),
-            'miner_concentration': np.random.beta(1, 4),
-            'attack_probability': np.random.uniform(0, 0.1),
-            'node_connectivity': np.random.uniform(0.8, 1.0),
-            'hash_rate_variance': np.random.uniform(0.01, 0.1)
+            'blocks_mined': np.random.randint(1, 100, size),
+            'transactions_count': np.random.randint(100, 5000, size),
+            'network_nodes': np.random.randint(1000, 5000, size),
+            'mining_power': np.random.uniform(10, 25, size),
+            'block_time': np.random.uniform(10, 15, size),
+            'difficulty': np.random.uniform(1e12, 5e13, size),
+            'hash_rate': np.random.lognormal(20, 1, size),
+            'transaction_volume': np.random.lognormal(12, 1.5, size),
+            'mining_pool_concentration': np.random.beta(2, 5, size),
+            'orphan_blocks': np.random.poisson(0.1, size),
+            'network_latency': np.random.exponential(2, size),
+            'hash_rate_skew': np.random.normal(0, 0.1, size),
+            'block_reorg_depth': np.random.poisson(0.05, size),
+            'gas_price': np.random.exponential(20, size),
+            'contract_creations': np.random.poisson(15, size),
+            'failed_transactions': np.random.poisson(2, size),
+            'unique_addresses': np.random.normal(5000, 1000, size),
+            'miner_rewards': np.random.normal(2, 0.3, size),
+            'uncle_blocks': np.random.poisson(0.5, size),
+            'hash_power_imbalance': np.random.beta(1, 3, size),
+            'network_health': np.random.uniform(0.7, 1.0, size),
+            'mining_efficiency': np.random.uniform(5, 15, size),
+            'transaction_success_rate': np.random.uniform(0.95, 0.99, size),
+            'network_growth': np.random.normal(0.001, 0.005, size),
+            'miner_concentration': np.random.beta(1, 4, size),
+            'attack_probability': np.random.uniform(0, 0.1, size),
+            'node_connectivity': np.random.uniform(0.8, 1.0, size),
+            'hash_rate_variance': np.random.uniform(0.01, 0.1, size)
         }
 
     def train_model(self):
@@ -464,15 +545,7 @@ class MLService:
     def predict_anomaly(self, blockchain_data=None):
         """Predict if current blockchain state is anomalous - IMPROVED with real block status"""
         if not self.is_trained or self.model is None:
-            return {
-                "is_anomaly": False,
-                "confidence": 0,
-                "error": "Model not trained",
-                "timestamp": datetime.now().isoformat(),
-                "attack_type": "none",
-                "current_block": 0,
-                "model_version": "v1"
-            }
+            return dict(_UNTRAINED_RESULT, timestamp=datetime.now().isoformat())
 
         try:
             # Extract features from current blockchain state
@@ -627,102 +700,27 @@ class MLService:
         block_status = self.simblock_service.get_block_status(current_block)
         active_attacks = self.attack_service.get_active_attacks()
 
-        # Create feature vector with REAL blockchain data
-        features = []
-
-        # Basic features from REAL blockchain data
-        features.extend([
+        # Basic features from REAL blockchain data, followed by the
+        # precomputed tail for the current block status
+        transactions = blockchain_data.get('transactions', 0)
+        live = np.array([
             float(blockchain_data.get('blocks', 0)),
-            float(blockchain_data.get('transactions', 0)),  # REAL transaction count
+            float(transactions),  # REAL transaction count
             float(blockchain_data.get('nodes', 100)),
             float(blockchain_data.get('mining_power', 15.6)),
             float(blockchain_data.get('block_time', 12.5)),
             float(blockchain_data.get('difficulty', 18500000000000)),  # REAL difficulty
             float(blockchain_data.get('hash_rate', 15.6)),
-            float(blockchain_data.get('transactions', 0) * 0.001),  # REAL transaction volume
+            float(transactions * 0.001),  # REAL transaction volume
         ])
-
-        # Generate features based on actual block status
-        if block_status == "attack_success":
-            # Features for successful attacks
-            features.extend([
-                0.7,  # mining_pool_concentration
-                2.0,  # orphan_blocks
-                3.0,  # network_latency
-                0.6,  # hash_rate_skew
-                1.5,  # block_reorg_depth
-                25.0,  # gas_price
-                8.0,  # contract_creations
-                5.0,  # failed_transactions
-                3000,  # unique_addresses
-                2.5,  # miner_rewards
-                1.2,  # uncle_blocks
-                0.6,  # hash_power_imbalance
-                0.6,  # network_health
-                8.0,  # mining_efficiency
-                0.85,  # transaction_success_rate
-                -0.002,  # network_growth
-                0.7,  # miner_concentration
-                0.8,  # attack_probability
-                0.7,  # node_connectivity
-                0.2  # hash_rate_variance
-            ])
-        elif block_status == "attack_failed":
-            # Features for failed attacks
-            features.extend([
-                0.4,  # mining_pool_concentration
-                0.8,  # orphan_blocks
-                2.5,  # network_latency
-                0.3,  # hash_rate_skew
-                0.8,  # block_reorg_depth
-                20.0,  # gas_price
-                12.0,  # contract_creations
-                3.0,  # failed_transactions
-                4500,  # unique_addresses
-                2.2,  # miner_rewards
-                0.6,  # uncle_blocks
-                0.4,  # hash_power_imbalance
-                0.8,  # network_health
-                10.0,  # mining_efficiency
-                0.92,  # transaction_success_rate
-                0.001,  # network_growth
-                0.5,  # miner_concentration
-                0.4,  # attack_probability
-                0.85,  # node_connectivity
-                0.15  # hash_rate_variance
-            ])
-        else:
-            # Normal pattern
-            features.extend([
-                0.3,  # mining_pool_concentration
-                0.1,  # orphan_blocks
-                1.8,  # network_latency
-                0.05,  # hash_rate_skew
-                0.05,  # block_reorg_depth
-                18.5,  # gas_price
-                14,  # contract_creations
-                1.2,  # failed_transactions
-                4800,  # unique_addresses
-                2.1,  # miner_rewards
-                0.4,  # uncle_blocks
-                0.25,  # hash_power_imbalance
-                0.92,  # network_health
-                11.5,  # mining_efficiency
-                0.98,  # transaction_success_rate
-                0.003,  # network_growth
-                0.35,  # miner_concentration
-                0.08,  # attack_probability
-                0.94,  # node_connectivity
-                0.06  # hash_rate_variance
-            ])
+        tail = _STATUS_FEATURES.get(block_status, _NORMAL_FEATURES)
 
         # Ensure we have exactly the right number of features
-        if len(features) != len(self.features):
-            features = features[:len(self.features)]
-            if len(features) < len(self.features):
-                features.extend([0.0] * (len(self.features) - len(features)))
+        features = np.zeros((1, len(self.features)))
+        values = np.concatenate((live, tail))[:len(self.features)]
+        features[0, :len(values)] = values
 
-        return np.array(features).reshape(1, -1)
+        return features
 
     def get_ml_status(self):
         """Get ML service status for API"""
@@ -13,6 +13,7 @@ import os
 import json
 import random
 import re
+from contextlib import contextmanager
 from datetime import datetime
 
 
@@ -23,6 +24,10 @@ class HybridSimBlockService:
         self.is_running = False
         self.simulation_thread = None
         self.using_real_simblock = False
+        self._chain_changed = threading.Condition()  # notified when a block is mined or the simulation stops
+        self._stop_requested = threading.Event()  # wakes the mock loop out of its block interval
+        self._stopped = threading.Event()  # set once the running simulation has fully shut down
+        self._stopped.set()
 
         # File paths
         self.output_log = "data/simblock_output.txt"
@@ -136,6 +141,8 @@ class HybridSimBlockService:
                 bufsize=1
             )
 
+            self._stop_requested.clear()
+            self._stopped.clear()
             self.is_running = True
             self.using_real_simblock = True
 
@@ -286,6 +293,7 @@ class HybridSimBlockService:
         self.blockchain_data["last_block_time"] = datetime.now().isoformat()
         self.blockchain_data["transactions"] += block_info["transactions"]
 
+        self._notify_chain_changed()
         print(f"🔗 Real Block #{current_block} processed")
 
     def _update_from_real_transaction(self, line):
@@ -340,6 +348,8 @@ class HybridSimBlockService:
         self.transaction_pool = []
         self.transaction_history = []
 
+        self._stop_requested.clear()
+        self._stopped.clear()
         self.is_running = True
         self.using_real_simblock = False
 
@@ -377,7 +387,7 @@ class HybridSimBlockService:
             f.write(f"Network Size: {node_count} nodes\n")
             f.write("Consensus: Proof of Work\n\n")
 
-        time.sleep(2)  # Initialization delay
+        self._stop_requested.wait(2)  # Initialization delay
 
         while self.is_running:
             try:
@@ -405,6 +415,8 @@ class HybridSimBlockService:
                 self.blockchain_data["total_gas_used"] += 21000 + (transactions_in_block * 100)
                 self.blockchain_data["average_base_fee"] = 10 + (block_height // 10)
 
+                self._notify_chain_changed()
+
                 # Generate transaction data
                 block_transactions = self._generate_transaction_data(block_height, transactions_in_block)
 
@@ -454,7 +466,7 @@ class HybridSimBlockService:
                     self.blockchain_data["nodes"] = max(50, min(150, nodes_online))
                     print(f"🖥️ Network update: {self.blockchain_data['nodes']} nodes online")
 
-                time.sleep(block_interval)
+                self._stop_requested.wait(block_interval)
 
             except Exception as e:
                 print(f"Mock simulation error: {e}")
@@ -467,6 +479,8 @@ class HybridSimBlockService:
 
         print("✅ Mock simulation thread stopped")
         self.is_running = False
+        self._notify_chain_changed()
+        self._stopped.set()
 
     def _generate_transaction_data(self, block_number, transaction_count):
         """Generate realistic transaction data for a block"""
@@ -501,6 +515,8 @@ class HybridSimBlockService:
 
         print("🛑 Stopping simulation...")
         self.is_running = False
+        self._stop_requested.set()
+        self._notify_chain_changed()
 
         # Stop Real SimBlock process
         if self.using_real_simblock and self.process:
@@ -509,6 +525,7 @@ class HybridSimBlockService:
                 self.process.wait(timeout=5.0)
             except subprocess.TimeoutExpired:
                 self.process.kill()
+            self._stopped.set()
 
         # Log simulation stop
         with open(self.output_log, "a", encoding="utf-8") as f:
@@ -516,6 +533,34 @@ class HybridSimBlockService:
 
         return {"status": "success", "message": "Simulation stopped"}
 
+    @contextmanager
+    def simulation(self, node_count=110):
+        """Run a simulation for the duration of a with-block; a run this call started is always stopped afterwards"""
+        result = self.start_simulation(node_count)
+        try:
+            yield result
+        finally:
+            # Leave alone a run someone else started (e.g. "Simulation already running")
+            if result["status"] == "success":
+                self.stop_simulation()
+
+    def _notify_chain_changed(self):
+        """Wake threads waiting in wait_for_blocks"""
+        with self._chain_changed:
+            self._chain_changed.notify_all()
+
+    def wait_for_blocks(self, count=1, timeout=None):
+        """Wait until at least count blocks are mined (or the simulation stops); returns whether count was reached"""
+        with self._chain_changed:
+            self._chain_changed.wait_for(
+                lambda: self.blockchain_data["blocks"] >= count or not self.is_running, timeout
+            )
+        return self.blockchain_data["blocks"] >= count
+
+    def wait_stopped(self, timeout=None):
+        """Wait until the simulation has fully shut down; returns whether it did within timeout"""
+        return self._stopped.wait(timeout)
+
     def get_status(self):
         """Get current simulation status"""
         return {
@@ -538,6 +583,20 @@ class HybridSimBlockService:
         print(f"🎯 Marking Block #{block_number} for {attack_type} - Success: {success}")
         return True
 
+    def mark_block_attacks(self, marks):
+        """Mark several blocks as under attack in one call; marks are (block_number, attack_type, success)"""
+        self.block_status.update(
+            (block_number, "attack_success" if success else "attack_failed") for block_number, _, success in marks
+        )
+        known = set(self.attack_blocks)
+        for block_number, _, _ in marks:
+            if block_number not in known:
+                known.add(block_number)
+                self.attack_blocks.append(block_number)
+
+        print(f"🎯 Marked {len(marks)} block attack(s): {sorted({block_number for block_number, _, _ in marks})}")
+        return True
+
     def get_block_status(self, block_number):
         """Get status of specific block"""
         return self.block_status.get(block_number, "normal")
@@ -0,0 +1,59 @@
+# test_attack_routes.py
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from app.services.attack_service import AttackService, AttackType
+
+
+class _RunningSimulation:
+    """Minimal stand-in for the SimBlock service that reports a running chain"""
+    is_running = True
+    blockchain_data = {"blocks": 1}
+
+    def mark_block_attack(self, block_number, attack_type, success):
+        return True
+
+
+def test_attack_batch_rejects_malformed_bodies():
+    """Bodies that are not an object with a 'scenarios' list get a 400"""
+    client = create_app().test_client()
+
+    for body in ([], [1], "scenarios", {"scenarios": "51-percent"}):
+        response = client.post('/api/attack/batch', json=body)
+        assert response.status_code == 400, body
+        assert response.get_json()["status"] == "error"
+
+
+def test_attack_batch_reports_bad_scenarios_per_item():
+    """Invalid scenarios get an error entry each without failing the whole batch"""
+    client = create_app().test_client()
+
+    response = client.post('/api/attack/batch', json={"scenarios": [
+        "51-percent",
+        {"endpoint": "no-such-attack"},
+        {"endpoint": ["eclipse"]},
+        {"endpoint": "eclipse", "params": [25]},
+    ]})
+
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert [result["status"] for result in results] == ["error"] * 4
+    assert results[0]["message"].startswith("Invalid scenario")
+    assert results[1]["message"] == "Unknown attack: no-such-attack"
+    assert results[2]["message"].startswith("Unknown attack")
+    assert results[3]["message"] == "Invalid params for eclipse"
+
+
+def test_attack_ids_unique_within_one_second():
+    """Two attacks of the same type started back to back keep separate records"""
+    attack_service = AttackService(_RunningSimulation())
+
+    first = attack_service.start_attack(AttackType.FIFTY_ONE_PERCENT, {"hash_power": 60})
+    second = attack_service.start_attack(AttackType.FIFTY_ONE_PERCENT, {"hash_power": 10})
+
+    assert first["attack_id"] != second["attack_id"]
+    assert attack_service.active_attacks[first["attack_id"]]["parameters"] == {"hash_power": 60}
+    assert attack_service.active_attacks[second["attack_id"]]["parameters"] == {"hash_power": 10}
@@ -6,365 +6,575 @@ Tests all phases of the Blockchain Anomaly Detection System
 
 import sys
 import os
+import socket
 import time
 import requests
 import json
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Use orjson for request/response bodies when installed, stdlib json otherwise
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# Seconds a decoded GET payload may be reused by later checks; any POST clears the cache
+GET_CACHE_TTL = 2.0
+
+# Per-request (connect, read) timeouts in seconds; ML training gets a longer read budget
+CONNECT_TIMEOUT = 2
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, 10)
+TRAINING_TIMEOUT = (CONNECT_TIMEOUT, 120)
+
+# Status polling: first retry after POLL_INITIAL_DELAY seconds, growing by POLL_BACKOFF up to POLL_MAX_DELAY
+POLL_INITIAL_DELAY = 0.5
+POLL_BACKOFF = 1.3
+POLL_MAX_DELAY = 5.0
+
+# Seconds phase 5 waits for the block targeted by the phase 4 attacks (one mock block interval plus slack)
+ATTACK_BLOCK_TIMEOUT = 15
+
+# Keep-alive connections held per host, and worker threads for concurrent probes
+POOL_MAXSIZE = 16
+
+# Retry idempotent requests that fail to connect or hit a transient gateway/overload status; POSTs are
+# never retried, and read timeouts are raised at once so each request stays within its timeout
+RETRY_POLICY = Retry(total=2, connect=2, read=False, status=2, backoff_factor=0.2,
+                     status_forcelist=(502, 503, 504), raise_on_status=False)
+
+# Report heading and phase separator lines
+BANNER = "=" * 70
+RULE = "-" * 40
+
+# Result icon per check outcome
+ICON = {True: "✅", False: "❌"}
+
+# Leading bytes of a ZIP archive, checked on the phase 6 report download
+ZIP_SIGNATURE = b"PK\x03\x04"
+
+# Attack scenarios launched in phase 4 (built once, shared by every run)
+ATTACK_SCENARIOS = (
+    {"name": "Double Spending", "endpoint": "double-spending", "params": {"amount": 50}},
+    {"name": "51% Attack", "endpoint": "51-percent", "params": {"hash_power": 60}},
+    {"name": "Selfish Mining", "endpoint": "selfish-mining", "params": {"max_blocks": 2}},
+    {"name": "Eclipse Attack", "endpoint": "eclipse", "params": {"target_node": 25}}
+)
+
+# Phase 2 simulation start body, encoded once at import
+SIMULATION_START_BODY = _dumps({"node_count": 30})
+
+# Attack request bodies, encoded once at import: one per scenario plus the
+# /api/attack/batch body that launches every scenario in one round trip
+ATTACK_BODIES = {a["endpoint"]: _dumps(a["params"]) for a in ATTACK_SCENARIOS}
+ATTACK_BATCH_BODY = _dumps({
+    "scenarios": [{"endpoint": a["endpoint"], "params": a["params"]} for a in ATTACK_SCENARIOS]
+})
+
+# Status endpoints probed at the end of phase 7
+FINAL_STATUS_ENDPOINTS = ('simblock/status', 'ml/status', 'attack/stats', 'kaggle/status')
+
+# API paths (relative to /api/) hit by the suite; joined to base_url once per instance
+API_PATHS = (
+    'simblock/start', 'simblock/stop',
+    'ml/train', 'ml/start-detection', 'ml/predictions', 'ml/stop-detection',
+    'kaggle/generate-csv-reports', 'kaggle/download-all-csv-reports', 'kaggle/dataset-stats',
+    'attack/batch', 'dashboard/status', 'health/all',
+    *FINAL_STATUS_ENDPOINTS,
+    *(f"attack/{attack['endpoint']}" for attack in ATTACK_SCENARIOS),
+)
+
+# Checks counted under each phase in the final report's breakdown
+REPORT_PHASES = {
+    'System Initialization': ('flask_app', 'service_health', 'static_files'),
+    'Blockchain Simulation': ('simulation_start', 'block_production', 'simulation_status'),
+    'ML Training': ('ml_training', 'ml_status'),
+    'Attack Simulation': ('attack_simulation',),
+    'Anomaly Detection': ('detection_start', 'anomaly_detection', 'detection_stop'),
+    'Data Export': ('csv_generation', 'report_download', 'dataset_stats'),
+    'System Integration': ('dashboard_integration', 'simulation_stop', 'final_status'),
+}
+
+
+def _port_open(host, port, timeout=0.5):
+    """Check whether something accepts TCP connections on host:port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex((host, port)) == 0
+
 
 class CompleteProjectTest:
-    def __init__(self):
-        self.base_url = "http://localhost:5000"
+    def __init__(self, base_url="http://localhost:5000", interactive=False, verbose=True):
+        self.base_url = base_url
+        self.index_url = f"{base_url}/"
+        self.stylesheet_url = f"{base_url}/static/styles.css"
+        self.api = {path: f"{base_url}/api/{path}" for path in API_PATHS}
+        self.interactive = interactive
+        self.verbose = verbose
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._pool = ThreadPoolExecutor(max_workers=POOL_MAXSIZE)
         self.test_results = {}
+        self.phase_timings = {}
+        self._preflight = None
+        self._attack_target_block = None  # latest block an accepted phase 4 attack targets
+        self._get_cache = {}  # url -> (fetched_at, decoded payload)
+        self._out = []
+
+    def _log(self, line=""):
+        """Buffer a report line until the next flush"""
+        self._out.append(f"{line}\n")
+
+    def _flush(self):
+        """Write buffered report lines to stdout in one call"""
+        sys.stdout.write("".join(self._out))
+        sys.stdout.flush()
+        self._out.clear()
+
+    def _log_result(self, passed, message, *args):
+        """Log a check outcome; passing checks are only formatted and shown when verbose"""
+        if self.verbose or not passed:
+            self._log(f"{ICON[passed]} {message.format(*args) if args else message}")
+
+    @contextmanager
+    def _check(self, key, label, failure="Failed"):
+        """Run one check, recording it as failed if anything inside raises"""
+        try:
+            yield
+        except Exception as e:
+            if key is not None:
+                self.test_results[key] = False
+            reason = "Timed out" if isinstance(e, requests.Timeout) else f"{failure} - {type(e).__name__}"
+            self._log_result(False, "{}: {}", label, reason)
+
+    def _request(self, method, url, **kwargs):
+        """Send a request through the shared session, bounded by DEFAULT_TIMEOUT"""
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return self.session.request(method, url, **kwargs)
+
+    @staticmethod
+    def _json(response):
+        """Decode a JSON response body"""
+        return _loads(response.content)
+
+    def _get(self, url, **kwargs):
+        """GET through the shared session"""
+        return self._request("GET", url, **kwargs)
+
+    def _post(self, url, **kwargs):
+        """POST through the shared session; cached GET payloads may be stale afterwards"""
+        self._get_cache.clear()
+        return self._request("POST", url, **kwargs)
+
+    def _post_encoded(self, url, body, **kwargs):
+        """POST an already-encoded JSON body"""
+        return self._post(url, data=body, headers={"Content-Type": "application/json"}, **kwargs)
+
+    def _get_concurrently(self, urls):
+        """GET independent URLs on the shared thread pool, returning completed futures in input order"""
+        futures = [self._pool.submit(self._get, url) for url in urls]
+        wait(futures)
+        return futures
+
+    def _get_all(self, urls):
+        """GET independent URLs concurrently, returning responses in input order"""
+        return [future.result() for future in self._get_concurrently(urls)]
+
+    def _warm_up(self):
+        """Open the pooled connection before the first timed check, keeping the reply for check 1.1"""
+        try:
+            self._preflight = self.session.head(self.index_url, timeout=CONNECT_TIMEOUT)
+        except requests.RequestException:
+            self._preflight = None
+
+    def _poll(self, url, timeout, predicate):
+        """Poll url with exponential backoff until predicate(payload) holds; returns that payload, or None on timeout"""
+        deadline = time.monotonic() + timeout
+        delay = POLL_INITIAL_DELAY
+        while True:
+            # Never let a single slow reply carry the poll past its deadline
+            remaining = max(deadline - time.monotonic(), 0.1)
+            try:
+                payload = self._get_json(url, max_age=0,
+                                         timeout=(min(CONNECT_TIMEOUT, remaining), min(DEFAULT_TIMEOUT[1], remaining)))
+                if predicate(payload):
+                    return payload
+            except Exception:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(delay, remaining))
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+
+    def _require(self, label, checks, *prerequisites):
+        """Check prerequisites; if any did not pass, record checks as skipped (None) and return False"""
+        missing = [key for key in prerequisites if not self.test_results.get(key)]
+        if not missing:
+            return True
+
+        for key in checks:
+            self.test_results[key] = None
+        self._log(f"⏭️ {label}: Skipped - needs {', '.join(missing)}")
+        return False
+
+    def _pause(self, seconds=1):
+        """Presentation pause, skipped for unattended runs"""
+        if self.interactive:
+            time.sleep(seconds)
+
+    def _get_json(self, url, max_age=GET_CACHE_TTL, timeout=DEFAULT_TIMEOUT):
+        """GET and decode a JSON payload, reusing the last one for url if younger than max_age"""
+        cached = self._get_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        payload = self._json(self._get(url, timeout=timeout))
+        self._get_cache[url] = (time.monotonic(), payload)
+        return payload
 
     def run_complete_test_suite(self):
         """Run complete test suite for all project phases"""
 
-        print("🚀 COMPLETE BLOCKCHAIN ANOMALY DETECTION SYSTEM TEST")
-        print("=" * 70)
-
-        # Phase 1: System Initialization
-        self.phase_1_system_initialization()
-
-        # Phase 2: Blockchain Simulation
-        self.phase_2_blockchain_simulation()
-
-        # Phase 3: ML Model Training
-        self.phase_3_ml_training()
-
-        # Phase 4: Attack Simulation
-        self.phase_4_attack_simulation()
+        self._log("🚀 COMPLETE BLOCKCHAIN ANOMALY DETECTION SYSTEM TEST")
+        self._log(BANNER)
+        self._warm_up()
+
+        phases = (
+            ('System Initialization', self.phase_1_system_initialization),
+            ('Blockchain Simulation', self.phase_2_blockchain_simulation),
+            ('ML Training', self.phase_3_ml_training),
+            ('Attack Simulation', self.phase_4_attack_simulation),
+            ('Anomaly Detection', self.phase_5_anomaly_detection),
+            ('Data Export', self.phase_6_data_export),
+            ('System Integration', self.phase_7_system_integration),
+        )
+        for index, (name, phase) in enumerate(phases):
+            started = time.perf_counter()
+            phase()
+            self.phase_timings[name] = time.perf_counter() - started
+            self._flush()
+
+            # Nothing downstream can pass without the app, so don't wait out every timeout;
+            # the phases left out are reported as skipped rather than failed
+            if not self.test_results.get('flask_app', False):
+                self._log("\n⛔ Flask application unreachable, skipping remaining phases")
+                for remaining, _ in phases[index + 1:]:
+                    self.test_results.update(dict.fromkeys(REPORT_PHASES[remaining]))
+                break
 
-        # Phase 5: Anomaly Detection
-        self.phase_5_anomaly_detection()
-
-        # Phase 6: Data Export & Analytics
-        self.phase_6_data_export()
-
-        # Phase 7: System Integration
-        self.phase_7_system_integration()
-
-        # Final Report
         self.generate_final_report()
+        self._flush()
+
+        self._pool.shutdown()
+        self.session.close()
 
     def phase_1_system_initialization(self):
         """Test Phase 1: System Initialization & Services"""
-        print("\n📦 PHASE 1: SYSTEM INITIALIZATION")
-        print("-" * 40)
+        self._log("\n📦 PHASE 1: SYSTEM INITIALIZATION")
+        self._log(RULE)
+
+        # Every phase 1 probe is an independent read, so fetch them all at once
+        # and report in the usual order; the index page is only fetched if warm-up didn't reach it
+        probes = [self.api['health/all'], self.stylesheet_url]
+        if self._preflight is None:
+            probes.append(self.index_url)
+        health, stylesheet, *index = self._get_concurrently(probes)
 
         # Test 1.1: Flask Application
-        try:
-            response = requests.get(f"{self.base_url}/")
+        with self._check('flask_app', "1.1 Flask Application"):
+            response = self._preflight if self._preflight is not None else index[0].result()
             self.test_results['flask_app'] = response.status_code == 200
-            print(f"✅ 1.1 Flask Application: {response.status_code}")
-        except:
-            self.test_results['flask_app'] = False
-            print("❌ 1.1 Flask Application: Failed")
-
-        # Test 1.2: All Services Status
-        services = ['dashboard', 'ml', 'attack', 'kaggle']
-        for service in services:
-            try:
-                response = requests.get(f"{self.base_url}/api/{service}/status")
-                self.test_results[f'{service}_service'] = response.status_code == 200
-                print(f"✅ 1.2 {service.title()} Service: Active")
-            except:
-                self.test_results[f'{service}_service'] = False
-                print(f"❌ 1.2 {service.title()} Service: Inactive")
+            self._log_result(self.test_results['flask_app'], "1.1 Flask Application: {}", response.status_code)
+
+        # Test 1.2: All Services Status (one aggregate probe covers every service the server reports)
+        with self._check('service_health', "1.2 Service Health"):
+            service_health = self._json(health.result())
+            for service, active in service_health.items():
+                self._log_result(active, "1.2 {} Service: {}", service.title(), 'Active' if active else 'Inactive')
+            self.test_results['service_health'] = bool(service_health) and all(service_health.values())
 
         # Test 1.3: Static Files
-        try:
-            response = requests.get(f"{self.base_url}/static/styles.css")
+        with self._check('static_files', "1.3 Static Files"):
+            response = stylesheet.result()
             self.test_results['static_files'] = response.status_code == 200
-            print("✅ 1.3 Static Files: Loaded")
-        except:
-            self.test_results['static_files'] = False
-            print("❌ 1.3 Static Files: Failed")
+            self._log_result(self.test_results['static_files'], "1.3 Static Files: {}",
+                             'Loaded' if self.test_results['static_files'] else 'Failed')
 
     def phase_2_blockchain_simulation(self):
         """Test Phase 2: Blockchain Simulation System"""
-        print("\n⛓️ PHASE 2: BLOCKCHAIN SIMULATION")
-        print("-" * 40)
+        self._log("\n⛓️ PHASE 2: BLOCKCHAIN SIMULATION")
+        self._log(RULE)
 
         # Test 2.1: Start Simulation
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/simblock/start",
-                json={"node_count": 30}
-            )
-            data = response.json()
+        with self._check('simulation_start', "2.1 Simulation Start"):
+            response = self._post_encoded(self.api['simblock/start'], SIMULATION_START_BODY)
+            data = self._json(response)
             self.test_results['simulation_start'] = data.get('status') == 'success'
             simulation_type = data.get('type', 'unknown')
-            print(f"✅ 2.1 Simulation Start: {simulation_type.upper()}")
-        except:
-            self.test_results['simulation_start'] = False
-            print("❌ 2.1 Simulation Start: Failed")
+            self._log_result(self.test_results['simulation_start'], "2.1 Simulation Start: {}", simulation_type.upper())
 
         # Test 2.2: Monitor Block Production
-        print("⏳ 2.2 Monitoring block production (15 seconds)...")
-        blocks_produced = False
-        for i in range(15):
-            try:
-                response = requests.get(f"{self.base_url}/api/simblock/status")
-                data = response.json()
-                blocks = data.get('blockchain_data', {}).get('blocks', 0)
-                if blocks > 0:
-                    blocks_produced = True
-                    print(f"   ✅ Block #{blocks} mined")
-                    break
-            except:
-                pass
-            time.sleep(1)
+        self._log("⏳ 2.2 Monitoring block production (15 seconds)...")
+        self._flush()
+        data = self._poll(self.api['simblock/status'], 15,
+                          lambda status: status.get('blockchain_data', {}).get('blocks', 0) > 0)
+        blocks_produced = data is not None
+        if blocks_produced:
+            self._log(f"   ✅ Block #{data['blockchain_data']['blocks']} mined")
 
         self.test_results['block_production'] = blocks_produced
-        print(f"✅ 2.2 Block Production: {'Success' if blocks_produced else 'Failed'}")
+        self._log_result(blocks_produced, "2.2 Block Production: {}", 'Success' if blocks_produced else 'Failed')
 
-        # Test 2.3: Simulation Status
-        try:
-            response = requests.get(f"{self.base_url}/api/simblock/status")
-            data = response.json()
+        # Test 2.3: Simulation Status (reuses the last poll from 2.2 when still fresh)
+        with self._check('simulation_status', "2.3 Simulation Status"):
+            data = self._get_json(self.api['simblock/status'])
             self.test_results['simulation_status'] = data.get('is_running', False)
-            print(f"✅ 2.3 Simulation Running: {data.get('is_running', False)}")
-        except:
-            self.test_results['simulation_status'] = False
-            print("❌ 2.3 Simulation Status: Failed")
+            self._log_result(self.test_results['simulation_status'],
+                             "2.3 Simulation Running: {}", data.get('is_running', False))
 
     def phase_3_ml_training(self):
         """Test Phase 3: ML Model Training"""
-        print("\n🤖 PHASE 3: MACHINE LEARNING TRAINING")
-        print("-" * 40)
+        self._log("\n🤖 PHASE 3: MACHINE LEARNING TRAINING")
+        self._log(RULE)
 
         # Test 3.1: Train ML Model
-        try:
-            print("⏳ 3.1 Training ML Model (this may take 20-30 seconds)...")
-            response = requests.post(f"{self.base_url}/api/ml/train")
-            data = response.json()
+        with self._check('ml_training', "3.1 ML Training"):
+            self._log("⏳ 3.1 Training ML Model (this may take 20-30 seconds)...")
+            self._flush()
+            response = self._post(self.api['ml/train'], timeout=TRAINING_TIMEOUT)
+            data = self._json(response)
             self.test_results['ml_training'] = data.get('status') == 'success'
             accuracy = data.get('accuracy', 0)
-            print(f"✅ 3.1 ML Training: {accuracy:.2%} Accuracy")
-        except Exception as e:
-            self.test_results['ml_training'] = False
-            print(f"❌ 3.1 ML Training: Failed - {e}")
+            self._log_result(self.test_results['ml_training'], "3.1 ML Training: {:.2%} Accuracy", accuracy)
 
         # Test 3.2: ML Model Status
-        try:
-            response = requests.get(f"{self.base_url}/api/ml/status")
-            data = response.json()
+        with self._check('ml_status', "3.2 ML Status"):
+            data = self._get_json(self.api['ml/status'])
             self.test_results['ml_status'] = data.get('training_status') == 'trained'
-            print(f"✅ 3.2 ML Status: {data.get('training_status', 'unknown')}")
-        except:
-            self.test_results['ml_status'] = False
-            print("❌ 3.2 ML Status: Failed")
+            self._log_result(self.test_results['ml_status'], "3.2 ML Status: {}",
+                             data.get('training_status', 'unknown'))
 
     def phase_4_attack_simulation(self):
         """Test Phase 4: Blockchain Attack Simulation"""
-        print("\n🔴 PHASE 4: BLOCKCHAIN ATTACK SIMULATION")
-        print("-" * 40)
+        self._log("\n🔴 PHASE 4: BLOCKCHAIN ATTACK SIMULATION")
+        self._log(RULE)
 
-        attacks = [
-            {"name": "Double Spending", "endpoint": "double-spending", "params": {"amount": 50}},
-            {"name": "51% Attack", "endpoint": "51-percent", "params": {"hash_power": 60}},
-            {"name": "Selfish Mining", "endpoint": "selfish-mining", "params": {"max_blocks": 2}},
-            {"name": "Eclipse Attack", "endpoint": "eclipse", "params": {"target_node": 25}}
-        ]
+        if not self._require("4 Attack Simulation", REPORT_PHASES['Attack Simulation'], 'simulation_start'):
+            return
 
+        attacks = ATTACK_SCENARIOS
         attack_results = []
 
+        # Unattended runs launch every scenario in one batched request
+        launched = None
+        if not self.interactive:
+            with self._check(None, "4.0 Attack Batch"):
+                response = self._post_encoded(self.api['attack/batch'], ATTACK_BATCH_BODY)
+                launched = [self._track_attack(result) for result in self._json(response)['results']]
+
         for i, attack in enumerate(attacks, 1):
-            try:
-                response = requests.post(
-                    f"{self.base_url}/api/attack/{attack['endpoint']}",
-                    json=attack['params']
-                )
-                data = response.json()
-                success = data.get('status') == 'success'
-                attack_results.append(success)
-                print(f"✅ 4.{i} {attack['name']}: {'Launched' if success else 'Failed'}")
-                time.sleep(2)  # Wait between attacks
-            except:
-                attack_results.append(False)
-                print(f"❌ 4.{i} {attack['name']}: Failed")
+            success = False
+            with self._check(None, f"4.{i} {attack['name']}"):
+                if launched is not None:
+                    success = launched[i - 1]
+                else:
+                    success = self._launch_attack(attack)
+                    self._pause(2)  # Wait between attacks
+                self._log_result(success, "4.{} {}: {}", i, attack['name'], 'Launched' if success else 'Failed')
+            attack_results.append(success)
 
         self.test_results['attack_simulation'] = any(attack_results)
-        print(f"✅ 4.0 Attack Simulation: {sum(attack_results)}/{len(attacks)} Successful")
+        self._log_result(self.test_results['attack_simulation'],
+                         "4.0 Attack Simulation: {}/{} Successful", sum(attack_results), len(attacks))
+
+    def _launch_attack(self, attack):
+        """Launch one attack scenario and report whether the server accepted it"""
+        response = self._post_encoded(self.api[f"attack/{attack['endpoint']}"], ATTACK_BODIES[attack['endpoint']])
+        return self._track_attack(self._json(response))
+
+    def _track_attack(self, reply):
+        """Remember the block an accepted attack targets; returns whether the server accepted it"""
+        accepted = reply.get('status') == 'success'
+        if accepted and reply.get('target_block') is not None:
+            self._attack_target_block = max(self._attack_target_block or 0, reply['target_block'])
+        return accepted
 
     def phase_5_anomaly_detection(self):
         """Test Phase 5: Real-time Anomaly Detection"""
-        print("\n🎯 PHASE 5: REAL-TIME ANOMALY DETECTION")
-        print("-" * 40)
+        self._log("\n🎯 PHASE 5: REAL-TIME ANOMALY DETECTION")
+        self._log(RULE)
+
+        if not self._require("5 Anomaly Detection", REPORT_PHASES['Anomaly Detection'],
+                             'simulation_start', 'ml_training'):
+            return
+
+        # Attacks mark the block after the one current at launch; wait for it to be mined
+        # so detection starts while the attacked block is the chain tip
+        target = self._attack_target_block
+        if target is not None:
+            self._log(f"⏳ 5.0 Waiting for attacked Block #{target}...")
+            self._flush()
+            self._poll(self.api['simblock/status'], ATTACK_BLOCK_TIMEOUT,
+                       lambda status: status.get('blockchain_data', {}).get('blocks', 0) >= target)
 
         # Test 5.1: Start Anomaly Detection
-        try:
-            response = requests.post(f"{self.base_url}/api/ml/start-detection")
-            data = response.json()
-            self.test_results['detection_start'] = data.get('status') == 'success'
-            print("✅ 5.1 Anomaly Detection: Started")
-        except:
-            self.test_results['detection_start'] = False
-            print("❌ 5.1 Anomaly Detection: Failed to start")
+        with self._check('detection_start', "5.1 Anomaly Detection", "Failed to start"):
+            response = self._post(self.api['ml/start-detection'])
+            data = self._json(response)
+            started = self.test_results['detection_start'] = data.get('status') == 'success'
+            self._log_result(started, "5.1 Anomaly Detection: {}", 'Started' if started else 'Failed to start')
 
         # Test 5.2: Monitor Detection
-        print("⏳ 5.2 Monitoring anomaly detection (10 seconds)...")
-        anomalies_detected = False
-        for i in range(10):
-            try:
-                response = requests.get(f"{self.base_url}/api/ml/predictions?limit=5")
-                data = response.json()
-                predictions = data.get('recent_predictions', [])
-                if any(p.get('is_anomaly', False) for p in predictions):
-                    anomalies_detected = True
-                    print("   ✅ Anomaly detected!")
-                    break
-            except:
-                pass
-            time.sleep(1)
+        self._log("⏳ 5.2 Monitoring anomaly detection (10 seconds)...")
+        self._flush()
+        anomalies_detected = self._poll(
+            f"{self.api['ml/predictions']}?limit=5", 10,
+            lambda data: any(p.get('is_anomaly', False) for p in data.get('recent_predictions', []))
+        ) is not None
+        if anomalies_detected:
+            self._log("   ✅ Anomaly detected!")
 
         self.test_results['anomaly_detection'] = anomalies_detected
-        print(f"✅ 5.2 Anomaly Detection: {'Success' if anomalies_detected else 'No anomalies'}")
+        self._log_result(anomalies_detected, "5.2 Anomaly Detection: {}",
+                         'Success' if anomalies_detected else 'No anomalies')
 
         # Test 5.3: Stop Detection
-        try:
-            response = requests.post(f"{self.base_url}/api/ml/stop-detection")
-            self.test_results['detection_stop'] = response.json().get('status') == 'success'
-            print("✅ 5.3 Anomaly Detection: Stopped")
-        except:
-            self.test_results['detection_stop'] = False
-            print("❌ 5.3 Anomaly Detection: Failed to stop")
+        with self._check('detection_stop', "5.3 Anomaly Detection", "Failed to stop"):
+            response = self._post(self.api['ml/stop-detection'])
+            stopped = self.test_results['detection_stop'] = self._json(response).get('status') == 'success'
+            self._log_result(stopped, "5.3 Anomaly Detection: {}", 'Stopped' if stopped else 'Failed to stop')
 
     def phase_6_data_export(self):
         """Test Phase 6: Data Export & Analytics"""
-        print("\n📊 PHASE 6: DATA EXPORT & ANALYTICS")
-        print("-" * 40)
+        self._log("\n📊 PHASE 6: DATA EXPORT & ANALYTICS")
+        self._log(RULE)
 
         # Test 6.1: Generate CSV Reports
-        try:
-            response = requests.post(f"{self.base_url}/api/kaggle/generate-csv-reports")
-            data = response.json()
+        with self._check('csv_generation', "6.1 CSV Reports"):
+            response = self._post(self.api['kaggle/generate-csv-reports'])
+            data = self._json(response)
             self.test_results['csv_generation'] = data.get('status') == 'success'
             reports_count = len(data.get('reports', []))
-            print(f"✅ 6.1 CSV Reports: {reports_count} reports generated")
-        except:
-            self.test_results['csv_generation'] = False
-            print("❌ 6.1 CSV Reports: Failed")
+            self._log_result(self.test_results['csv_generation'], "6.1 CSV Reports: {} reports generated",
+                             reports_count)
 
         # Test 6.2: Download Reports
-        try:
-            response = requests.get(f"{self.base_url}/api/kaggle/download-all-csv-reports")
-            self.test_results['report_download'] = response.status_code == 200
-            print("✅ 6.2 Report Download: Success")
-        except:
-            self.test_results['report_download'] = False
-            print("❌ 6.2 Report Download: Failed")
+        with self._check('report_download', "6.2 Report Download"):
+            # Stream and read just the ZIP signature instead of pulling the whole archive
+            with self._get(self.api['kaggle/download-all-csv-reports'], stream=True) as response:
+                signature = next(response.iter_content(len(ZIP_SIGNATURE)), b"")
+                self.test_results['report_download'] = response.status_code == 200 and signature == ZIP_SIGNATURE
+                size = response.headers.get('Content-Length')
+            if not self.test_results['report_download']:
+                self._log_result(False, "6.2 Report Download: Failed")
+            elif size:
+                self._log_result(True, "6.2 Report Download: Success ({:.1f} KB)", int(size) / 1024)
+            else:
+                self._log_result(True, "6.2 Report Download: Success")
 
         # Test 6.3: Dataset Statistics
-        try:
-            response = requests.get(f"{self.base_url}/api/kaggle/dataset-stats")
-            data = response.json()
+        with self._check('dataset_stats', "6.3 Dataset Stats"):
+            response = self._get(self.api['kaggle/dataset-stats'])
+            data = self._json(response)
             self.test_results['dataset_stats'] = data.get('status') == 'success'
             samples = data.get('total_samples', 0)
-            print(f"✅ 6.3 Dataset Stats: {samples} samples available")
-        except:
-            self.test_results['dataset_stats'] = False
-            print("❌ 6.3 Dataset Stats: Failed")
+            self._log_result(self.test_results['dataset_stats'], "6.3 Dataset Stats: {} samples available", samples)
 
     def phase_7_system_integration(self):
         """Test Phase 7: System Integration & Dashboard"""
-        print("\n🌐 PHASE 7: SYSTEM INTEGRATION")
-        print("-" * 40)
+        self._log("\n🌐 PHASE 7: SYSTEM INTEGRATION")
+        self._log(RULE)
 
         # Test 7.1: Dashboard Integration
-        try:
-            response = requests.get(f"{self.base_url}/api/dashboard/status")
-            data = response.json()
-            self.test_results['dashboard_integration'] = data.get('status') == 'running'
-            print("✅ 7.1 Dashboard Integration: Active")
-        except:
-            self.test_results['dashboard_integration'] = False
-            print("❌ 7.1 Dashboard Integration: Failed")
+        with self._check('dashboard_integration', "7.1 Dashboard Integration"):
+            data = self._get_json(self.api['dashboard/status'])
+            active = self.test_results['dashboard_integration'] = data.get('status') == 'running'
+            self._log_result(active, "7.1 Dashboard Integration: {}", 'Active' if active else 'Inactive')
 
         # Test 7.2: Stop Simulation
-        try:
-            response = requests.post(f"{self.base_url}/api/simblock/stop")
-            self.test_results['simulation_stop'] = response.json().get('status') == 'success'
-            print("✅ 7.2 Simulation Stop: Success")
-        except:
-            self.test_results['simulation_stop'] = False
-            print("❌ 7.2 Simulation Stop: Failed")
+        with self._check('simulation_stop', "7.2 Simulation Stop"):
+            response = self._post(self.api['simblock/stop'])
+            self.test_results['simulation_stop'] = self._json(response).get('status') == 'success'
+            self._log_result(self.test_results['simulation_stop'], "7.2 Simulation Stop: {}",
+                             'Success' if self.test_results['simulation_stop'] else 'Failed')
 
         # Test 7.3: Final System Status
-        try:
-            responses = {}
-            endpoints = ['simblock/status', 'ml/status', 'attack/stats', 'kaggle/status']
-            for endpoint in endpoints:
-                response = requests.get(f"{self.base_url}/api/{endpoint}")
-                responses[endpoint] = response.status_code == 200
+        with self._check('final_status', "7.3 Final Status"):
+            endpoints = FINAL_STATUS_ENDPOINTS
+            replies = self._get_all([self.api[endpoint] for endpoint in endpoints])
+            responses = {endpoint: reply.status_code == 200 for endpoint, reply in zip(endpoints, replies)}
 
             self.test_results['final_status'] = all(responses.values())
             active_services = sum(responses.values())
-            print(f"✅ 7.3 Final Status: {active_services}/{len(endpoints)} services active")
-        except:
-            self.test_results['final_status'] = False
-            print("❌ 7.3 Final Status: Failed")
+            self._log_result(self.test_results['final_status'],
+                             "7.3 Final Status: {}/{} services active", active_services, len(endpoints))
 
     def generate_final_report(self):
         """Generate comprehensive test report"""
-        print("\n" + "=" * 70)
-        print("📈 COMPREHENSIVE TEST REPORT")
-        print("=" * 70)
-
-        total_tests = len(self.test_results)
-        passed_tests = sum(self.test_results.values())
-        success_rate = (passed_tests / total_tests) * 100
-
-        print(f"📊 OVERALL RESULTS: {passed_tests}/{total_tests} Tests Passed ({success_rate:.1f}%)")
-        print("\n📋 DETAILED BREAKDOWN:")
-
-        phases = {
-            'System Initialization': ['flask_app', 'dashboard_service', 'ml_service', 'attack_service',
-                                      'kaggle_service', 'static_files'],
-            'Blockchain Simulation': ['simulation_start', 'block_production', 'simulation_status'],
-            'ML Training': ['ml_training', 'ml_status'],
-            'Attack Simulation': ['attack_simulation'],
-            'Anomaly Detection': ['detection_start', 'anomaly_detection', 'detection_stop'],
-            'Data Export': ['csv_generation', 'report_download', 'dataset_stats'],
-            'System Integration': ['dashboard_integration', 'simulation_stop', 'final_status']
-        }
-
-        for phase, tests in phases.items():
-            phase_tests = [self.test_results.get(test, False) for test in tests]
-            phase_passed = sum(phase_tests)
-            phase_total = len(phase_tests)
-            print(f"   {phase}: {phase_passed}/{phase_total}")
-
-        print("\n🎯 PROJECT STATUS:")
+        self._log(f"\n{BANNER}")
+        self._log("📈 COMPREHENSIVE TEST REPORT")
+        self._log(BANNER)
+
+        outcomes = Counter(self.test_results.values())
+        skipped_tests = outcomes[None]
+        total_tests = len(self.test_results) - skipped_tests
+        passed_tests = outcomes[True]
+        success_rate = (passed_tests / total_tests) * 100 if total_tests else 0.0
+
+        skipped = f", {skipped_tests} Skipped" if skipped_tests else ""
+        self._log(f"📊 OVERALL RESULTS: {passed_tests}/{total_tests} Tests Passed ({success_rate:.1f}%){skipped}")
+        self._log("\n📋 DETAILED BREAKDOWN:")
+
+        for phase, tests in REPORT_PHASES.items():
+            phase_passed = sum(self.test_results.get(test) is True for test in tests)
+            phase_total = sum(self.test_results.get(test, False) is not None for test in tests)
+            elapsed = self.phase_timings.get(phase)
+            timing = f" ({elapsed:.2f}s)" if elapsed is not None else ""
+            score = f"{phase_passed}/{phase_total}" if phase_total else "Skipped"
+            self._log(f"   {phase}: {score}{timing}")
+
+        self._log("\n🎯 PROJECT STATUS:")
         if success_rate >= 90:
-            print("   ✅ EXCELLENT - Project is fully functional and ready for deployment!")
+            self._log("   ✅ EXCELLENT - Project is fully functional and ready for deployment!")
         elif success_rate >= 75:
-            print("   ✅ GOOD - Project is functional with minor issues")
+            self._log("   ✅ GOOD - Project is functional with minor issues")
         elif success_rate >= 60:
-            print("   ⚠️  FAIR - Project works but needs improvements")
+            self._log("   ⚠️  FAIR - Project works but needs improvements")
         else:
-            print("   ❌ POOR - Project has significant issues")
+            self._log("   ❌ POOR - Project has significant issues")
 
-        print(f"\n🚀 NEXT STEPS:")
-        print("   1. Review failed tests above")
-        print("   2. Check server logs for errors")
-        print("   3. Verify all services are running")
-        print("   4. Test manual workflow in browser")
+        self._log(f"\n🚀 NEXT STEPS:")
+        self._log("   1. Review failed tests above")
+        self._log("   2. Check server logs for errors")
+        self._log("   3. Verify all services are running")
+        self._log("   4. Test manual workflow in browser")
 
 
 if __name__ == "__main__":
-    # Check if Flask app is running
-    try:
-        response = requests.get("http://localhost:5000", timeout=5)
+    # Check if Flask app is running (a bare port probe; phase 1.1 does the HTTP check)
+    if _port_open("127.0.0.1", 5000):
         print("✅ Flask application detected, starting tests...")
-    except:
+    else:
         print("❌ Flask application not running. Please start with: python main.py")
         print("   Then run: python test_complete_project.py")
         sys.exit(1)
 
-    tester = CompleteProjectTest()
+    # -q: only report failed checks
+    tester = CompleteProjectTest(verbose="-q" not in sys.argv[1:])
     tester.run_complete_test_suite()
\ No newline at end of file
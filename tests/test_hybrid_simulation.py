@@ -20,59 +20,74 @@ def test_hybrid_with_fallback():
 
     # Test 2: Start simulation (will try Real SimBlock first)
     print("\n2. 🚀 Starting Hybrid Simulation...")
-    result = simblock_service.start_simulation(node_count=50)
-
-    print(f"   - Initial Status: {result['status']}")
-    print(f"   - Initial Type: {result.get('type', 'unknown')}")
-
-    # Test 3: Monitor for fallback
-    print("\n3. 🔍 Monitoring for Automatic Fallback...")
-
-    simulation_switched = False
-
-    for i in range(40):  # Monitor for 40 seconds
-        status = simblock_service.get_status()
-        current_type = status['simulation_type']
-        blocks = status['blockchain_data']['blocks']
-        transactions = status['blockchain_data']['transactions']
-
-        print(f"   [{i + 1}/40] Type: {current_type} | Blocks: {blocks} | Transactions: {transactions}")
-
-        # Check if simulation switched from real to mock
-        if i > 5 and current_type == 'advanced_mock' and not simulation_switched:
-            simulation_switched = True
-            print("   ✅ SUCCESS: Automatic fallback to Mock Simulation detected!")
-
-        # Simulate attacks for ML testing
-        if blocks > 0 and i % 5 == 0:
-            simblock_service.mark_block_attack(blocks, "51_percent", True)
-            print(f"   🎯 Marked Block #{blocks} for attack testing")
-
-        time.sleep(1)
-
-        # Stop if we have good progress with mock
-        if blocks >= 10 and current_type == 'advanced_mock':
-            print("   ✅ Mock simulation working perfectly - stopping test")
-            break
-
-    # Test 4: Final analysis
-    print("\n4. 📊 Final Analysis:")
-    final_status = simblock_service.get_status()
-
-    print(f"   - Final Simulation Type: {final_status['simulation_type']}")
-    print(f"   - Total Blocks Mined: {final_status['blockchain_data']['blocks']}")
-    print(f"   - Total Transactions: {final_status['blockchain_data']['transactions']}")
-    print(f"   - Simulation Running: {final_status['is_running']}")
-
-    if final_status['blockchain_data']['blocks'] > 0:
-        print("   ✅ SUCCESS: Blockchain simulation is working!")
+    with simblock_service.simulation(node_count=50) as result:
+        print(f"   - Initial Status: {result['status']}")
+        print(f"   - Initial Type: {result.get('type', 'unknown')}")
+
+        # Test 3: Monitor for fallback
+        print("\n3. 🔍 Monitoring for Automatic Fallback...")
+
+        simulation_switched = False
+        pending_marks = []  # attack marks are applied in one batch once monitoring ends
+
+        started = time.monotonic()
+        for i in range(40):  # Monitor for 40 seconds
+            status = simblock_service.get_status()
+            chain = status['blockchain_data']
+            current_type = status['simulation_type']
+            blocks = chain['blocks']
+            transactions = chain['transactions']
+
+            print(f"   [{i + 1}/40] Type: {current_type} | Blocks: {blocks} | Transactions: {transactions}")
+
+            # Check if simulation switched from real to mock
+            if i > 5 and current_type == 'advanced_mock' and not simulation_switched:
+                simulation_switched = True
+                print("   ✅ SUCCESS: Automatic fallback to Mock Simulation detected!")
+
+            # Simulate attacks for ML testing
+            if blocks > 0 and i % 5 == 0:
+                pending_marks.append((blocks, "51_percent", True))
+                print(f"   🎯 Queued Block #{blocks} for attack testing")
+
+            # Wake on the next mined block, or at the next one-second tick at the latest;
+            # with no simulation running there is nothing to wake on, so just wait for the tick
+            next_tick = max(0.0, started + i + 1 - time.monotonic())
+            if simblock_service.is_running:
+                simblock_service.wait_for_blocks(blocks + 1, timeout=next_tick)
+            else:
+                time.sleep(next_tick)
+
+            # Stop if we have good progress with mock
+            if blocks >= 10 and current_type == 'advanced_mock':
+                print("   ✅ Mock simulation working perfectly - stopping test")
+                break
+
+        if pending_marks:
+            simblock_service.mark_block_attacks(pending_marks)
+
+        # Test 4: Final analysis
+        print("\n4. 📊 Final Analysis:")
+        final_status = simblock_service.get_status()
+        final_blocks = final_status['blockchain_data']['blocks']
+
+        print(f"   - Final Simulation Type: {final_status['simulation_type']}")
+        print(f"   - Total Blocks Mined: {final_blocks}")
+        print(f"   - Total Transactions: {final_status['blockchain_data']['transactions']}")
+        print(f"   - Simulation Running: {final_status['is_running']}")
+
+        if final_blocks > 0:
+            print("   ✅ SUCCESS: Blockchain simulation is working!")
+        else:
+            print("   ❌ ISSUE: No blocks were mined")
+
+    # Test 5: Clean stop (only a run this test started was stopped on leaving the block)
+    if result['status'] == 'success':
+        print("\n5. 🛑 Simulation Stopped")
+        print(f"   - Shut Down Cleanly: {simblock_service.wait_stopped(timeout=5)}")
     else:
-        print("   ❌ ISSUE: No blocks were mined")
-
-    # Test 5: Clean stop
-    print("\n5. 🛑 Stopping Simulation...")
-    stop_result = simblock_service.stop_simulation()
-    print(f"   - Stop Result: {stop_result['message']}")
+        print("\n5. ⏭️ Simulation Not Stopped - this test did not start it")
+    print(f"   - Simulation Running: {simblock_service.is_running}")
 
 
 if __name__ == "__main__":